@@ -7,7 +7,7 @@ from __future__ import annotations
 from importlib import metadata
 
 # NOTE: importing to have the types registered
-import h5pyckle.interop_builtins
+import h5pyckle.interop_builtins  # noqa: F401
 import h5pyckle.interop_numpy  # noqa: F401
 from h5pyckle.base import (
     PickleGroup,
@@ -22,7 +22,10 @@ from h5pyckle.base import (
     load_from_group,
     load_from_type,
     load_group_as_dict,
+    load_group_items,
+    load_records_from_group,
     loader,
+    register_record_dtype,
 )
 from h5pyckle.decorator import h5pyckable
 
@@ -42,5 +45,8 @@ __all__ = (
     "load_from_group",
     "load_from_type",
     "load_group_as_dict",
+    "load_group_items",
+    "load_records_from_group",
     "loader",
+    "register_record_dtype",
 )
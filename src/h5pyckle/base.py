@@ -44,6 +44,9 @@
 .. autofunction:: load_from_type
 .. autofunction:: load_from_attribute
 .. autofunction:: load_group_as_dict
+.. autofunction:: load_group_items
+.. autofunction:: register_record_dtype
+.. autofunction:: load_records_from_group
 """
 
 from __future__ import annotations
@@ -56,8 +59,10 @@ except ImportError:
     except ImportError:
         import pickle
 
+import sys
+import weakref
 from contextlib import suppress
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from pickle import UnpicklingError
 from typing import TYPE_CHECKING, Any
 
@@ -67,7 +72,7 @@ import numpy as np
 if TYPE_CHECKING:
     import io
     import os
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     # https://github.com/python/mypy/issues/5667
     PathLike = str | bytes | os.PathLike[Any] | io.IOBase
@@ -77,11 +82,42 @@ else:
 # {{{ wrapper for h5py.Group
 
 _H5PYCKLE_RESERVED_ATTRS = ["__type", "__type_name", "__pickle", "__version"]
+# NOTE: reserved names are matched exactly, unlike user-given exclude patterns
+_H5PYCKLE_RESERVED_NAMES = frozenset(_H5PYCKLE_RESERVED_ATTRS)
 _H5PYCKLE_VERSION = 2
 
+# NOTE: out-of-band pickle buffers are stored in a group with this suffix
+_PICKLE_BUFFERS_SUFFIX = "__buffers"
+
 # https://docs.h5py.org/en/stable/high/attr.html#attributes
 _MAX_ATTRIBUTE_SIZE = 2**13
 
+# https://docs.h5py.org/en/stable/high/file.html#file-space-strategies
+_FS_PAGE_SIZE = 2**12
+
+# dataspace shared by the type attributes written in `PickleGroup.append_type`
+_SCALAR_SPACE = h5py.h5s.create(h5py.h5s.SCALAR)
+
+# datasets smaller than this are not chunked or filtered
+_MIN_FILTERED_DATASET_SIZE = 2**16
+_FILTER_OPTIONS = frozenset({
+    "chunks",
+    "compression",
+    "compression_opts",
+    "shuffle",
+    "fletcher32",
+    "scaleoffset",
+})
+
+# dtypes used to store homogeneous sequences of builtin numbers
+_BUILTIN_NUMBER_DTYPES: dict[type, Any] = {float: np.float64, int: np.int64}
+
+# compound dtypes used to store homogeneous sequences of simple classes
+_RECORD_DTYPES: dict[type, tuple[np.dtype[Any], tuple[type, ...]]] = {}
+
+# pickled types, to avoid pickling the same class repeatedly
+_TYPE_PICKLE_CACHE: weakref.WeakKeyDictionary[type, bytes] = weakref.WeakKeyDictionary()
+
 
 def _reset_dataclass_field_types(cls: type[Any]) -> None:
     import dataclasses
@@ -98,6 +134,75 @@ def _reset_dataclass_field_types(cls: type[Any]) -> None:
         f._field_type = getattr(dataclasses, f._field_type.name)
 
 
+@lru_cache(maxsize=1024)
+def _unpickle_type(state: bytes) -> type[Any]:
+    # NOTE: siblings of the same type share the same pickled state, so this
+    # only unpickles and imports each class once
+    cls = pickle.loads(state)
+
+    import importlib
+
+    try:
+        mod = importlib.import_module(cls.__module__)
+        result = getattr(mod, cls.__name__)
+    except AttributeError:
+        result = cls
+
+    from dataclasses import is_dataclass
+
+    if is_dataclass(cls):
+        assert isinstance(cls, type)
+        _reset_dataclass_field_types(cls)
+
+    return result
+
+
+def _pickle_type(cls: type[Any]) -> bytes:
+    with suppress(KeyError):
+        return _TYPE_PICKLE_CACHE[cls]
+
+    state = pickle.dumps(cls)
+
+    # NOTE: some types cannot be weakly referenced, so they are not cached
+    with suppress(TypeError):
+        _TYPE_PICKLE_CACHE[cls] = state
+
+    return state
+
+
+def _create_scalar_attribute(gid: h5py.h5g.GroupID, name: str, value: Any) -> None:
+    # NOTE: this mirrors `AttributeManager.create`, which uses the logical type
+    # in the file and the in-memory type for writing
+    htype = h5py.h5t.py_create(value.dtype, logical=True)
+    attr = h5py.h5a.create(gid, name.encode(), htype, _SCALAR_SPACE)
+    try:
+        attr.write(value, mtype=h5py.h5t.py_create(value.dtype))
+    finally:
+        attr.close()
+
+
+def _drop_filters_for_small_datasets(
+    options: dict[str, Any],
+    shape: tuple[int, ...] | None,
+    dtype: Any,
+    data: np.ndarray | None,
+) -> dict[str, Any]:
+    # NOTE: scalar datasets do not support filters at all and small datasets
+    # (e.g. large pickles) would only pay for the chunk index
+    if data is not None:
+        data = np.asarray(data)
+        shape, nbytes = data.shape, data.nbytes
+    elif shape is not None:
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    else:
+        return options
+
+    if shape != () and nbytes >= _MIN_FILTERED_DATASET_SIZE:
+        return options
+
+    return {k: v for k, v in options.items() if k not in _FILTER_OPTIONS}
+
+
 class PickleGroup(h5py.Group):
     """Inherits from :class:`h5py.Group`."""
 
@@ -121,7 +226,7 @@ class PickleGroup(h5py.Group):
         super().__init__(gid)
 
         self.h5_dset_options = h5_dset_options
-        self._type = None
+        self._type: type[Any] | None = None
 
     @classmethod
     def from_h5(cls, h5: Any) -> "PickleGroup":
@@ -178,6 +283,7 @@ class PickleGroup(h5py.Group):
         shape: tuple[int, ...] | None = None,
         dtype: Any = None,
         data: "np.ndarray" | None = None,
+        **kwargs: Any,
     ) -> h5py.Dataset:
         """Thin wrapper around :meth:`h5py.Group.create_dataset`. It uses
         the options from :attr:`h5_dset_options` to create the dataset.
@@ -187,12 +293,19 @@ class PickleGroup(h5py.Group):
         :param dtype: :class:`numpy.dtype` of the new dataset.
         :param data: a :class:`numpy.ndarray` that contains the data for the
             dataset.
+        :param kwargs: default dataset creation options, e.g. ``chunks`` or
+            ``compression``. Any options given in :attr:`h5_dset_options`
+            take precedence over these.
         """
         if "/" in name:
             raise ValueError(f"dataset names cannot contain a '/': '{name}'")
 
+        options = {**kwargs, **self.h5_dset_options} if kwargs else self.h5_dset_options
+        if "compression" in options and "chunks" not in options:
+            options = _drop_filters_for_small_datasets(options, shape, dtype, data)
+
         return super().create_dataset(
-            name, shape=shape, dtype=dtype, data=data, **self.h5_dset_options
+            name, shape=shape, dtype=dtype, data=data, **options
         )
 
     def __getitem__(self, name: str) -> Any:
@@ -244,9 +357,14 @@ class PickleGroup(h5py.Group):
         if not (module is None or module == str.__module__):
             name = f"{module}.{name}"
 
-        self.attrs["__type"] = np.void(pickle.dumps(cls))
-        self.attrs["__type_name"] = name.encode()
-        self.attrs["__version"] = _H5PYCKLE_VERSION
+        # NOTE: the existence check above guarantees these attributes are new,
+        # so they are created directly without the delete-if-exists probe and
+        # type guessing done by `attrs.__setitem__`
+        _create_scalar_attribute(
+            self.id, "__type", np.array(np.void(_pickle_type(cls)))
+        )
+        _create_scalar_attribute(self.id, "__type_name", np.array(name.encode()))
+        _create_scalar_attribute(self.id, "__version", np.array(_H5PYCKLE_VERSION))
 
         return self
 
@@ -255,27 +373,15 @@ class PickleGroup(h5py.Group):
         """If the group has type information, this attribute will return the
         corresponding class.
         """
-        if not self.has_type:
-            raise AttributeError(f"group '{self.name}' has no known type")
-
         if self._type is None:
-            cls = pickle.loads(self.attrs["__type"].tobytes())
+            # NOTE: a single attribute read also doubles as the existence check
+            state = self.attrs.get("__type")
+            if state is None:
+                raise AttributeError(f"group '{self.name}' has no known type")
 
-            import importlib
+            self._type = _unpickle_type(state.tobytes())
 
-            try:
-                mod = importlib.import_module(cls.__module__)
-                self._type = getattr(mod, cls.__name__)
-            except AttributeError:
-                self._type = cls
-
-            from dataclasses import is_dataclass
-
-            if is_dataclass(cls):
-                assert isinstance(cls, type)
-                _reset_dataclass_field_types(cls)
-
-        return self._type  # type: ignore[return-value]
+        return self._type
 
     @property
     def has_type(self) -> bool:
@@ -338,16 +444,11 @@ def load_from_group(
     :param parent: a group in an open :class:`h5py.File`.
     :param exclude: a list of patterns to exclude when loading data.
     """
-    if exclude is None:
-        exclude = []
-
-    unique_exclude = set(list(exclude) + _H5PYCKLE_RESERVED_ATTRS)
-
     parent = PickleGroup.from_h5(parent)
     if parent.has_type:
         return load_from_type(parent)
 
-    return load_group_as_dict(parent, exclude=unique_exclude)
+    return load_group_as_dict(parent, exclude=exclude)
 
 
 def load_by_pattern(parent: PickleGroup, *, pattern: str) -> Any:
@@ -355,32 +456,61 @@ def load_by_pattern(parent: PickleGroup, *, pattern: str) -> Any:
     :param parent: a group in an open :class:`h5py.File`.
     :param pattern: the pattern is searched for using :meth:`h5py.Group.visit`
         and only the first match is returned. It searches through groups,
-        datasets, and their attributes.
+        datasets, their attributes, and the keys of dictionaries stored as a
+        single dataset.
     """
 
-    def callback(name: str, obj: Any) -> str | None:
+    def match_attr(key: bytes) -> bool | None:
+        return True if pattern in key.decode() else None
+
+    def match_items(name: str) -> int | None:
+        # NOTE: dictionaries of numbers can be stored as a single dataset of
+        # (key, value) pairs (see `interop_builtins`), so their keys are not
+        # group names and are checked separately
+        if name.rsplit("/", 1)[-1] != "__items":
+            return None
+
+        ds = parent[name]
+        if (
+            not isinstance(ds, h5py.Dataset)
+            or ds.parent.attrs.get("__layout") != "items"
+        ):
+            return None
+
+        for i, key in enumerate(ds["key"]):
+            if pattern in key.decode():
+                return i
+
+        return None
+
+    def callback(name: str) -> str | None:
         # TODO: should be easy to make this a regex
         if pattern in name:
             return name
 
-        for key in obj.attrs:
-            if pattern in key:
-                return name
+        # NOTE: the attribute names are checked with the low-level API, so
+        # that no Python objects are created for nodes that do not match
+        oid = h5py.h5o.open(parent.id, name.encode())
+        if h5py.h5a.iterate(oid, match_attr):
+            return name
+
+        if match_items(name) is not None:
+            return name
 
         return None
 
     parent = PickleGroup.from_h5(parent)
-    name = parent.visititems(callback)
+    name = parent.visit(callback)
     if name is None:
         raise ValueError(f"could not find any match for '{pattern}'")
 
     obj = parent[name]
     if pattern in name:
         # found a group / dataset
-        if obj.has_type:
-            return load_from_type(obj)
         if isinstance(obj, h5py.Dataset):
             return obj[:]
+        if obj.has_type:
+            return load_from_type(obj)
 
         return load_from_group(obj)
 
@@ -391,6 +521,10 @@ def load_by_pattern(parent: PickleGroup, *, pattern: str) -> Any:
             break
 
     if found is None:
+        index = match_items(name)
+        if index is not None:
+            return obj[index]["value"].item()
+
         # NOTE: this should really not fail since the pattern was found somewhere
         raise RuntimeError(f"attribute matching '{pattern}' not found in '{name}'")
 
@@ -411,7 +545,12 @@ def dump(
     :param mode: see :attr:`h5py.File.mode` and the
         :ref:`h5py docs <h5py:file_open>`.
     :param h5_file_options: additional options passed directly to the
-        :class:`h5py.File` constructor.
+        :class:`h5py.File` constructor. By default, new files are written
+        using the HDF5 1.10 file format (or newer), which has faster attribute
+        storage for groups with many attributes. They also track the creation
+        order of the root group and, when created on disk, use the paged file
+        space strategy. Existing files opened with *mode* ``"a"`` or ``"r+"``
+        are left as they are.
     :param h5_dset_options: additional options used when creating datasets.
         This is used when calling :meth:`PickleGroup.create_dataset`. See
         the :ref:`h5py docs <h5py:dataset>` for additional information
@@ -420,6 +559,27 @@ def dump(
     if h5_file_options is None:
         h5_file_options = {}
 
+    import os
+
+    # NOTE: the defaults are only used for new files, so that appending to an
+    # existing file does not change its format or layout
+    if mode in {"w", "w-", "x"}:
+        h5_file_options = {
+            "libver": ("v110", "latest"),
+            "track_order": True,
+            **h5_file_options,
+        }
+
+    if mode in {"w", "w-", "x"} and isinstance(filename, str | bytes | os.PathLike):
+        # NOTE: paged aggregation keeps the many small metadata blocks of the
+        # pickled groups close together, which makes loading them faster.
+        # This is not supported for Python file-like objects in h5py.
+        h5_file_options = {
+            "fs_strategy": "page",
+            "fs_page_size": _FS_PAGE_SIZE,
+            **h5_file_options,
+        }
+
     if h5_dset_options is None:
         h5_dset_options = {}
 
@@ -428,14 +588,24 @@ def dump(
         dump_to_group(obj, root)
 
 
-def load(filename: PathLike) -> Any:
+def load(
+    filename: PathLike,
+    *,
+    h5_file_options: dict[str, Any] | None = None,
+) -> Any:
     """
     :param filename: file to load pickled data from.
+    :param h5_file_options: additional options passed directly to the
+        :class:`h5py.File` constructor, e.g. ``rdcc_nbytes`` to increase the
+        chunk cache size when reading large chunked datasets.
     :returns: a :class:`dict` containing the full contents of the file. If
         only a subset of the file contains pickled data, use
         :func:`load_from_group` or :class:`load_by_pattern` instead.
     """
-    with h5py.File(filename, mode="r") as h5:
+    if h5_file_options is None:
+        h5_file_options = {}
+
+    with h5py.File(filename, mode="r", **h5_file_options) as h5:
         return load_from_group(h5)
 
 
@@ -444,14 +614,59 @@ def load(filename: PathLike) -> Any:
 
 # {{{ dump helpers
 
+# NOTE: names for sequence entries are reused, so they are created only once
+_ENTRY_NAMES = tuple(sys.intern(f"entry_{i}") for i in range(4096))
+
+
+def entry_name(i: int) -> str:
+    """
+    :returns: the name ``entry_{i}`` used for the *i*-th entry of a sequence
+        stored as separate groups or datasets (see :func:`dump_sequence_to_group`).
+    """
+    return _ENTRY_NAMES[i] if i < len(_ENTRY_NAMES) else f"entry_{i}"
+
 
 def pickle_to_group(obj: object, group: PickleGroup, *, name: str) -> None:
-    state = pickle.dumps(obj)
+    # NOTE: large buffers (e.g. from numpy arrays) are stored out-of-band in
+    # separate datasets, so that they are not copied into the pickle itself
+    buffers: list[Any] = []
+
+    def buffer_callback(buf: Any) -> bool:
+        if buf.raw().nbytes < _MAX_ATTRIBUTE_SIZE:
+            return True
+
+        buffers.append(buf)
+        return False
+
+    state = pickle.dumps(obj, protocol=5, buffer_callback=buffer_callback)
 
     if len(state) < _MAX_ATTRIBUTE_SIZE:
         group.attrs[name] = np.void(state)
     else:
-        group.create_dataset(name, data=np.array(state))
+        group.create_dataset(name, data=np.frombuffer(state, dtype=np.uint8))
+
+    if buffers:
+        grp = group.create_group(f"{name}{_PICKLE_BUFFERS_SUFFIX}")
+        for i, buf in enumerate(buffers):
+            grp.create_dataset(
+                entry_name(i), data=np.frombuffer(buf.raw(), dtype=np.uint8)
+            )
+
+
+def _number_sequence_to_array(
+    obj: set[Any] | Sequence[Any], types: set[type]
+) -> np.ndarray:
+    # NOTE: homogeneous sequences of builtin floats or ints are converted with a
+    # known dtype and size, which skips the dtype inference in `np.array`
+    if len(types) == 1:
+        (cls,) = types
+        if cls in _BUILTIN_NUMBER_DTYPES:
+            with suppress(OverflowError):
+                return np.fromiter(
+                    obj, dtype=_BUILTIN_NUMBER_DTYPES[cls], count=len(obj)
+                )
+
+    return np.array(obj if isinstance(obj, list | tuple) else list(obj))
 
 
 def dump_sequence_to_group(
@@ -468,17 +683,77 @@ def dump_sequence_to_group(
     :param obj: a class satisfying the :class:`collections.abc.Sequence` protocol.
     """
     grp = parent.create_type(name, obj)
-    obj = list(obj)
 
     from numbers import Number
 
-    is_number = all(isinstance(el, Number) for el in obj)
+    # NOTE: this gathers the types in a single pass, so that the checks below
+    # only need to look at each distinct type once
+    types = set(map(type, obj))
+    is_number = all(issubclass(cls, Number) for cls in types)
 
     if is_number:
-        grp.create_dataset("entry", data=np.array(obj))
-    else:
+        grp.create_dataset("entry", data=_number_sequence_to_array(obj, types))
+    elif not _dump_sequence_as_records(obj, grp, types):
         for i, el in enumerate(obj):
-            dumper(el, grp, name=f"entry_{i}")
+            dumper(el, grp, name=entry_name(i))
+
+
+def register_record_dtype(
+    cls: type[Any], dtype: np.dtype[Any], field_types: tuple[type, ...]
+) -> None:
+    """Register a compound *dtype* used to store sequences of *cls*.
+
+    Homogeneous sequences of *cls* are then stored as a single dataset of
+    records (see :func:`dump_sequence_to_group`) and loaded back using
+    :func:`load_records_from_group`.
+
+    :param dtype: a compound :class:`numpy.dtype` with one field for each
+        constructor argument of *cls*.
+    :param field_types: the exact types of the fields in *dtype*. Sequences
+        with values of any other type are stored entry by entry.
+    """
+    _RECORD_DTYPES[cls] = (dtype, field_types)
+
+
+def _dump_sequence_as_records(
+    obj: set[Any] | Sequence[Any], grp: PickleGroup, types: set[type]
+) -> bool:
+    # NOTE: sequences of the same simple class (e.g. a dataclass with only
+    # scalar fields) are stored as a single compound dataset
+    if len(types) != 1:
+        return False
+
+    (cls,) = types
+    layout = _RECORD_DTYPES.get(cls)
+    if layout is None:
+        return False
+
+    # NOTE: values are only packed if they are exactly of the annotated type,
+    # since numpy would otherwise silently convert them (e.g. 1.7 to 1 in an
+    # int field or "no" to True in a bool field) or fail on None
+    dtype, field_types = layout
+    assert dtype.names is not None
+    rows = [tuple(getattr(el, f) for f in dtype.names) for el in obj]
+    if not all(
+        type(value) is ftype
+        for row in rows
+        for value, ftype in zip(row, field_types, strict=True)
+    ):
+        return False
+
+    try:
+        grp.create_dataset("records", data=np.array(rows, dtype=dtype))
+    except (OverflowError, TypeError, ValueError):
+        # NOTE: e.g. large integers or strings with embedded NULs; h5py may
+        # have already created the dataset before failing to write it
+        if "records" in grp:
+            del grp["records"]
+
+        return False
+
+    grp.attrs["__records_type"] = np.void(_pickle_type(cls))
+
+    return True
 
 
 def dump_to_attribute(
@@ -510,14 +785,43 @@ def dump_to_attribute(
 
 
 def pickle_from_group(name: str, group: PickleGroup) -> Any:
+    # NOTE: datasets are uint8 arrays (or byte strings in older files) and
+    # attributes are np.void, which pickle reads through the buffer protocol
+    # without an intermediate bytes copy
     if name in group:
         obj = group[name][()]
     elif name in group.attrs:
-        obj = group.attrs[name].tobytes()
+        obj = group.attrs[name]
     else:
         return None
 
-    return pickle.loads(obj)
+    buffers = group.get(f"{name}{_PICKLE_BUFFERS_SUFFIX}")
+    if buffers is None:
+        return pickle.loads(obj)
+
+    return pickle.loads(
+        obj, buffers=[buffers[entry_name(i)][:] for i in range(len(buffers))]
+    )
+
+
+def load_records_from_group(group: PickleGroup) -> list[Any]:
+    """Load a sequence stored as records by :func:`dump_sequence_to_group`.
+
+    :returns: a :class:`list` of instances of the class given to
+        :func:`register_record_dtype`.
+    """
+    cls = _unpickle_type(group.attrs["__records_type"].tobytes())
+
+    ds = group["records"]
+    assert ds.dtype.names is not None
+    names = ds.dtype.names
+    strings = {f for f in names if h5py.check_string_dtype(ds.dtype[f]) is not None}
+
+    records = ds[()]
+    for f in strings:
+        records[f] = [x.decode() for x in records[f]]
+
+    return [cls(**dict(zip(names, row, strict=True))) for row in records.tolist()]
 
 
 def load_from_type(group: PickleGroup, *, cls: type[Any] | None = None) -> Any:
@@ -548,51 +852,72 @@ def load_from_attribute(name: str, group: PickleGroup) -> Any:
     if name not in group.attrs:
         return None
 
-    attr = group.attrs[name]
+    return _unpickle_attribute(group.attrs[name])
+
+
+def _unpickle_attribute(attr: Any) -> Any:
     if isinstance(attr, np.void):
         attr = attr.tobytes()
 
-    if isinstance(attr, bytes):
+    # NOTE: pickles from protocol 2 onwards start with the PROTO opcode, so
+    # other byte strings are returned as is without trying to unpickle them
+    if isinstance(attr, bytes) and attr[:1] == b"\x80":
         with suppress(UnpicklingError):
             attr = pickle.loads(attr)
 
     return attr
 
 
-def load_group_as_dict(
+def load_group_items(
     parent: PickleGroup,
     exclude: set[str] | Sequence[str] | None = None,
-) -> dict[str, Any]:
-    """Loads all the datasets and attributes of *parent* into a dictionary.
+) -> Iterator[tuple[str, Any]]:
+    """Loads all the datasets and attributes of *parent* one at a time.
+
+    This is a lazy version of :func:`load_group_as_dict` that can be passed
+    directly to a :class:`dict`-like constructor.
 
     :param exclude: a list of datasets or attributes to exclude when loading.
+    :returns: an iterator over ``(name, value)`` pairs.
     """
-    if exclude is None:
-        exclude = []
-    unique_exclude = set(list(exclude) + _H5PYCKLE_RESERVED_ATTRS)
+    reserved = _H5PYCKLE_RESERVED_NAMES
+    patterns = () if exclude is None else tuple(set(exclude) - reserved)
 
     from h5py import Dataset
 
-    groups = {}
     for name in parent:
-        if any(ex in name for ex in unique_exclude):
+        if name in reserved or any(ex in name for ex in patterns):
             continue
 
         obj = parent[name]
-        if obj.has_type:
-            groups[name] = load_from_type(obj)
-        elif isinstance(obj, Dataset):
-            groups[name] = obj[:]
-        else:
+        if isinstance(obj, Dataset):
+            yield name, obj[:]
+            continue
+
+        if not obj.has_type:
             raise TypeError(f"cannot unpickle '{name}'")
 
-    for name in parent.attrs:
-        if any(ex in name for ex in unique_exclude):
+        # NOTE: the class is passed on, so that `load_from_type` does not
+        # check for the type again
+        yield name, load_from_type(obj, cls=obj.pycls)
+
+    attrs = parent.attrs
+    for name in attrs:
+        if name in reserved or any(ex in name for ex in patterns):
             continue
 
-        groups[name] = load_from_attribute(name, parent)
+        yield name, _unpickle_attribute(attrs[name])
+
+
+def load_group_as_dict(
+    parent: PickleGroup,
+    exclude: set[str] | Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """Loads all the datasets and attributes of *parent* into a dictionary.
 
-    return groups
+    :param exclude: a list of datasets or attributes to exclude when loading.
+    """
+    return dict(load_group_items(parent, exclude=exclude))
 
 
 # }}}
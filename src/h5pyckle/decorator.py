@@ -12,6 +12,8 @@ from __future__ import annotations
 from dataclasses import Field, fields, is_dataclass
 from typing import Any
 
+import numpy as np
+
 from h5pyckle.base import (
     PickleGroup,
     dump_to_attribute,
@@ -19,6 +21,7 @@ from h5pyckle.base import (
     load_from_attribute,
     load_from_type,
     loader,
+    register_record_dtype,
 )
 
 _SCALAR_CLASSES = (int, float, str, bytes)
@@ -39,8 +42,52 @@ def _is_scalar_field(f: Field[Any]) -> bool:
 # {{{ dataclasses
 
 
+def _get_record_layout(cls: type) -> tuple[np.dtype[Any], tuple[type, ...]] | None:
+    import typing
+
+    import h5py
+
+    try:
+        # NOTE: this also resolves annotations given as strings
+        hints = typing.get_type_hints(cls)
+    except (NameError, TypeError):
+        return None
+
+    record_dtypes: dict[Any, Any] = {
+        bool: np.bool_,
+        int: np.int64,
+        float: np.float64,
+        str: h5py.string_dtype(),
+    }
+
+    fields_dtype = []
+    fields_type = []
+    for f in fields(cls):
+        ftype = hints[f.name]
+        dtype = record_dtypes.get(ftype)
+        if not f.init or dtype is None:
+            return None
+
+        fields_dtype.append((f.name, dtype))
+        fields_type.append(ftype)
+
+    if not fields_dtype:
+        return None
+
+    return np.dtype(fields_dtype), tuple(fields_type)
+
+
 def _h5pyckle_dataclass(cls: type) -> type:
-    # FIXME: just generate and exec the code to avoid the for loop?
+    layout = _get_record_layout(cls)
+    if layout is not None:
+        register_record_dtype(cls, *layout)
+
+    # NOTE: the fields are fixed once the dataclass is created, so they are
+    # split here instead of being inspected again on every dump and load
+    init_fields = [f for f in fields(cls) if f.init]
+    scalar_names = tuple(f.name for f in init_fields if _is_scalar_field(f))
+    group_names = tuple(f.name for f in init_fields if not _is_scalar_field(f))
+    init_names = tuple(f.name for f in init_fields)
 
     @dumper.register(cls)
     def _dump_dataclass(
@@ -48,28 +95,21 @@ def _h5pyckle_dataclass(cls: type) -> type:
     ) -> None:
         group = parent.create_type(name, obj)
 
-        for f in fields(cls):
-            if not f.init:
-                continue
+        for fname in scalar_names:
+            dump_to_attribute(getattr(obj, fname), group, name=fname)
 
-            value = getattr(obj, f.name)
-            if _is_scalar_field(f):
-                dump_to_attribute(value, group, name=f.name)
-            else:
-                dumper(value, group, name=f.name)
+        for fname in group_names:
+            dumper(getattr(obj, fname), group, name=fname)
 
     @loader.register(cls)
     def _load_dataclass(parent: PickleGroup) -> Any:
         kwargs = {}
-        for f in fields(cls):
-            if not f.init:
-                continue
-
-            value = load_from_attribute(f.name, parent)
-            if f.name in parent:
-                value = load_from_type(parent[f.name])
+        for fname in init_names:
+            value = load_from_attribute(fname, parent)
+            if fname in parent:
+                value = load_from_type(parent[fname])
 
-            kwargs[f.name] = value
+            kwargs[fname] = value
 
         return parent.pycls(**kwargs)
 
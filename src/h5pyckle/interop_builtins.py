@@ -8,6 +8,7 @@ from numbers import Number
 from typing import Any
 
 import h5py
+import numpy as np
 
 from h5pyckle.base import (
     PickleGroup,
@@ -76,6 +77,10 @@ def _load_int(parent: PickleGroup) -> int:
 
 # {{{ dict
 
+_DICT_ITEMS_NAME = "__items"
+_DICT_LAYOUT_ATTR = "__layout"
+_DICT_ITEMS_DTYPES: dict[type, Any] = {float: np.float64, int: np.int64}
+
 
 @dumper.register(dict)
 def _dump_dict(
@@ -86,15 +91,60 @@ def _dump_dict(
     else:
         group = parent.create_type(name, obj)
 
+    if _dump_dict_as_items(obj, group):
+        return
+
     for key, value in obj.items():
         dumper(value, group, name=key)
 
 
+def _dump_dict_as_items(obj: dict[str, Any], parent: PickleGroup) -> bool:
+    # NOTE: dictionaries with only builtin floats (or ints) as values are
+    # stored as a single compound dataset of (key, value) pairs, which avoids
+    # creating a separate group for each value
+    types = set(map(type, obj.values()))
+    if len(types) != 1:
+        return False
+
+    (cls,) = types
+    if cls not in _DICT_ITEMS_DTYPES or not all(isinstance(k, str) for k in obj):
+        return False
+
+    dtype = np.dtype([
+        ("key", h5py.string_dtype()),
+        ("value", _DICT_ITEMS_DTYPES[cls]),
+    ])
+
+    try:
+        items = np.fromiter(obj.items(), dtype=dtype, count=len(obj))
+    except OverflowError:
+        return False
+
+    parent.create_dataset(_DICT_ITEMS_NAME, data=items)
+    parent.attrs[_DICT_LAYOUT_ATTR] = "items"
+
+    return True
+
+
+def _is_dict_items_layout(parent: PickleGroup) -> bool:
+    # NOTE: the marker alone could also be a user string value, but dictionary
+    # values are never stored as bare datasets, so together they are unique
+    return parent.attrs.get(_DICT_LAYOUT_ATTR) == "items" and isinstance(
+        parent.get(_DICT_ITEMS_NAME), h5py.Dataset
+    )
+
+
 @loader.register(dict)
 def _load_dict(parent: PickleGroup) -> dict[str, Any]:
-    from h5pyckle.base import load_group_as_dict
+    from h5pyckle.base import load_group_items
+
+    if _is_dict_items_layout(parent):
+        items = parent[_DICT_ITEMS_NAME][:]
+        keys = [k.decode() for k in items["key"]]
+
+        return parent.pycls(zip(keys, items["value"].tolist(), strict=True))
 
-    return parent.pycls(load_group_as_dict(parent))
+    return parent.pycls(load_group_items(parent))
 
 
 # }}}
@@ -119,17 +169,28 @@ def _dump_sequence(
 
 @loader.register(list)
 def _load_list(parent: PickleGroup) -> list[Any]:
-    from h5pyckle.base import load_group_as_dict
+    from h5pyckle.base import load_from_attribute
 
     if "entry" in parent:
         assert isinstance(parent["entry"], h5py.Dataset)
         return list(parent["entry"][:])
 
-    entries = load_group_as_dict(parent)
+    if "records" in parent:
+        from h5pyckle.base import load_records_from_group
+
+        return parent.pycls(load_records_from_group(parent))
+
+    # NOTE: entries are all named "entry_XXXX" and can be stored as groups or
+    # attributes (e.g. strings), so we place them directly by their index
+    groups = list(parent)
+    attrs = [name for name in parent.attrs if name.startswith("entry_")]
+
+    values: list[Any] = [None] * (len(groups) + len(attrs))
+    for name in groups:
+        values[int(name[6:])] = load_from_type(parent[name])
 
-    # NOTE: entries are all named "entry_XXXX", so we sort them by the index
-    keys = sorted(entries, key=lambda el: int(el[6:]))
-    values = [entries[k] for k in keys]
+    for name in attrs:
+        values[int(name[6:])] = load_from_attribute(name, parent)
 
     return parent.pycls(values)
 
@@ -4,19 +4,13 @@
 
 from __future__ import annotations
 
-try:
-    import cloudpickle as pickle
-except ImportError:
-    try:
-        import dill as pickle
-    except ImportError:
-        import pickle
-
 import threading
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any, NamedTuple, overload
 
 import arraycontext.impl.pyopencl.taggable_cl_array as tga
+import h5py
 import numpy as np
 import pyopencl.array as cla
 from arraycontext import Array, ArrayContext
@@ -30,8 +24,16 @@ from meshmode.discretization.poly_element import PolynomialRecursiveNodesElement
 from meshmode.dof_array import DOFArray
 from meshmode.mesh import Mesh, MeshElementGroup
 
-import h5pyckle.interop_numpy  # noqa: F401
-from h5pyckle.base import PickleGroup, dumper, load_from_type, loader
+from h5pyckle.base import (
+    PickleGroup,
+    dump_to_attribute,
+    dumper,
+    load_from_attribute,
+    load_from_type,
+    loader,
+    pickle_from_group,
+)
+from h5pyckle.interop_numpy import create_array_dataset
 
 __all__ = ("array_context_for_pickling",)
 
@@ -80,12 +82,30 @@ def get_array_context() -> ArrayContext:
     return actx
 
 
+@overload
+def to_numpy(x: None) -> None: ...
+
+
+@overload
+def to_numpy(x: Array) -> np.ndarray: ...
+
+
 def to_numpy(x: Array | None) -> np.ndarray | None:
     if x is None:
         return x
 
+    # NOTE: arrays that already live on the host (e.g. from a numpy-based
+    # array context) can be written directly, without any copies
+    if isinstance(x, np.ndarray):
+        return x
+
     actx = get_array_context()
-    result = actx.to_numpy(actx.thaw(x))
+
+    # NOTE: only frozen arrays need to be thawed, which allocates a new array
+    if getattr(x, "queue", None) is None:
+        x = actx.thaw(x)
+
+    result = actx.to_numpy(x)
     assert isinstance(result, np.ndarray)
 
     return result
@@ -106,6 +126,42 @@ def from_numpy(x: np.ndarray | None, *, frozen: bool = True) -> Array | None:
 # }}}
 
 
+# {{{ datasets
+
+
+def _create_index_dataset(parent: PickleGroup, name: str, ary: np.ndarray) -> None:
+    # NOTE: indices are stored using the smallest integer type that can hold
+    # them and are converted back to the original type when reading
+    dtype = ary.dtype
+    if ary.size and dtype.kind in "iu":
+        dtype = np.promote_types(
+            np.min_scalar_type(ary.min()), np.min_scalar_type(ary.max())
+        )
+
+    if dtype.itemsize >= ary.dtype.itemsize:
+        create_array_dataset(parent, name, ary)
+    else:
+        ds = create_array_dataset(parent, name, ary.astype(dtype))
+        ds.attrs["dtype"] = ary.dtype.str
+
+
+def _read_array_dataset(parent: PickleGroup, name: str) -> np.ndarray:
+    # NOTE: this reads directly into an uninitialized array, without going
+    # through the generic selection machinery in `h5py.Dataset.__getitem__`
+    ds = parent[name]
+    ary = np.empty(ds.shape, dtype=ds.dtype)
+    if ary.size:
+        ds.read_direct(ary)
+
+    if "dtype" in ds.attrs:
+        ary = ary.astype(ds.attrs["dtype"])
+
+    return ary
+
+
+# }}}
+
+
 # {{{ cla.Array
 
 
@@ -116,10 +172,7 @@ def _dump_cl_array(
     group = parent.create_type(name, obj)
 
     group.attrs["frozen"] = obj.queue is None
-    group.create_dataset(
-        "entry",
-        data=to_numpy(tga.to_tagged_cl_array(obj)),
-    )
+    create_array_dataset(group, "entry", to_numpy(tga.to_tagged_cl_array(obj)))
 
 
 @loader.register(cla.Array)
@@ -141,7 +194,7 @@ def _dump_taggable_cl_array(
     dumper(obj.axes, group, name="axes")
     dumper(obj.tags, group, name="tags")
 
-    group.create_dataset("entry", data=to_numpy(obj))
+    create_array_dataset(group, "entry", to_numpy(obj))
 
 
 @loader.register(tga.TaggableCLArray)
@@ -168,18 +221,48 @@ def _dump_dof_array(
     group = parent.create_type(name, obj)
     group.attrs["frozen"] = obj.array_context is None
 
-    dumper([to_numpy(x) for x in obj], group, name="entries")
+    entries = [to_numpy(x) for x in obj]
+    if not entries or len({(x.dtype, x.ndim) for x in entries}) != 1:
+        dumper(entries, group, name="entries")
+        return
+
+    # NOTE: all the entries are stored in a single flat dataset, so that they
+    # can be written and read with a single call
+    offsets = np.cumsum([0, *(x.size for x in entries)])
+    create_array_dataset(
+        group, "entries_flat", np.concatenate([x.reshape(-1) for x in entries])
+    )
+    group.attrs["entries_offsets"] = offsets
+    group.attrs["entries_shapes"] = np.array([x.shape for x in entries])
+
+
+def _load_dof_array_entries(parent: PickleGroup) -> list[np.ndarray]:
+    if "entries" in parent:
+        return load_from_type(parent["entries"])
+
+    flat = _read_array_dataset(parent, "entries_flat")
+    offsets = parent.attrs["entries_offsets"]
+    shapes = parent.attrs["entries_shapes"]
+
+    return [
+        flat[offsets[i] : offsets[i + 1]].reshape(shape)
+        for i, shape in enumerate(shapes)
+    ]
 
 
 @loader.register(DOFArray)
 def _load_dof_array(parent: PickleGroup) -> DOFArray:
-    entries = load_from_type(parent["entries"])
+    entries = _load_dof_array_entries(parent)
+    frozen = bool(parent.attrs["frozen"])
 
-    array_context = None if parent.attrs["frozen"] else get_array_context()
-    return parent.pycls(
-        array_context,
-        tuple(from_numpy(x, frozen=parent.attrs["frozen"]) for x in entries),
-    )
+    # NOTE: all the transfers are started before any array is frozen, since
+    # freezing waits for the pending operations to finish
+    actx = get_array_context()
+    data = [actx.from_numpy(x) for x in entries]
+    if frozen:
+        data = [actx.freeze(x) for x in data]
+
+    return parent.pycls(None if frozen else actx, tuple(data))
 
 
 # }}}
@@ -188,6 +271,18 @@ def _load_dof_array(parent: PickleGroup) -> DOFArray:
 # {{{ mesh
 
 
+def _dump_dtype_attr(parent: PickleGroup, name: str, dtype: np.dtype) -> None:
+    # NOTE: these are simple dtypes, so there's no need for a full subgroup
+    parent.attrs[name] = np.dtype(dtype).str
+
+
+def _load_dtype_attr(parent: PickleGroup, name: str) -> np.dtype:
+    if name in parent.attrs:
+        return np.dtype(parent.attrs[name])
+
+    return load_from_type(parent[name])
+
+
 def _dump_order(parent: PickleGroup, order) -> None:
     if isinstance(order, tuple):
         dumper(order, parent, name="order")
@@ -202,33 +297,51 @@ def _load_order(parent: PickleGroup):
     return load_from_type(parent["order"])
 
 
+def _dump_element_group_attrs(
+    parent: PickleGroup, obj: MeshElementGroup | ElementGroupBase
+) -> None:
+    # NOTE: integer orders are stored together with the dimension, so that
+    # they can be read back from a single attribute
+    if isinstance(obj.order, int):
+        parent.attrs["order_dim"] = np.array([obj.order, obj.dim])
+    else:
+        _dump_order(parent, obj.order)
+        parent.attrs["dim"] = obj.dim
+
+
+def _load_element_group_attrs(parent: PickleGroup) -> tuple[Any, int]:
+    # NOTE: h5py extracts these as np.intp
+    if "order_dim" in parent.attrs:
+        order, dim = parent.attrs["order_dim"].tolist()
+        return order, dim
+
+    return _load_order(parent), int(parent.attrs["dim"])
+
+
 @dumper.register(MeshElementGroup)
 def _dump_mesh_element_grouo(
     obj: MeshElementGroup, parent: PickleGroup, *, name: str | None = None
 ) -> None:
     parent = parent.create_type(name, obj)
 
-    _dump_order(parent, obj.order)
-    parent.attrs["dim"] = obj.dim
+    _dump_element_group_attrs(parent, obj)
 
     if obj.vertex_indices is not None:
-        parent.create_dataset("vertex_indices", data=obj.vertex_indices)
-    parent.create_dataset("nodes", data=obj.nodes)
-    parent.create_dataset("unit_nodes", data=obj.unit_nodes)
+        _create_index_dataset(parent, "vertex_indices", obj.vertex_indices)
+    create_array_dataset(parent, "nodes", obj.nodes)
+    create_array_dataset(parent, "unit_nodes", obj.unit_nodes)
 
 
 @loader.register(MeshElementGroup)
 def _load_mesh_element_group(parent: PickleGroup) -> MeshElementGroup:
-    # NOTE: h5py extracts these as np.intp
-    order = _load_order(parent)
-    dim = int(parent.attrs["dim"])
+    order, dim = _load_element_group_attrs(parent)
 
     if "vertex_indices" in parent:
-        vertex_indices = parent["vertex_indices"][:]
+        vertex_indices = _read_array_dataset(parent, "vertex_indices")
     else:
         vertex_indices = None
-    nodes = parent["nodes"][:]
-    unit_nodes = parent["unit_nodes"][:]
+    nodes = _read_array_dataset(parent, "nodes")
+    unit_nodes = _read_array_dataset(parent, "unit_nodes")
 
     cls = parent.pycls
     assert issubclass(cls, MeshElementGroup)
@@ -241,16 +354,16 @@ def _dump_mesh(obj: Mesh, parent: PickleGroup, *, name: str | None = None) -> No
     parent = parent.create_type(name, obj)
 
     if hasattr(obj, "boundary_tags"):
-        parent.attrs["boundary_tags"] = np.void(pickle.dumps(obj.boundary_tags))
+        dumper(obj.boundary_tags, parent, name="boundary_tags")
 
     if obj.is_conforming is not None:
         parent.attrs["is_conforming"] = obj.is_conforming
 
     if obj.vertices is not None:
-        parent.create_dataset("vertices", data=obj.vertices)
+        create_array_dataset(parent, "vertices", obj.vertices)
 
-    dumper(obj.vertex_id_dtype, parent, name="vertex_id_dtype")
-    dumper(obj.element_id_dtype, parent, name="element_id_dtype")
+    _dump_dtype_attr(parent, "vertex_id_dtype", obj.vertex_id_dtype)
+    _dump_dtype_attr(parent, "element_id_dtype", obj.element_id_dtype)
     dumper(obj.groups, parent, name="groups")
 
     # TODO
@@ -262,8 +375,13 @@ def _dump_mesh(obj: Mesh, parent: PickleGroup, *, name: str | None = None) -> No
 def _load_mesh(parent: PickleGroup) -> Mesh:
     kwargs = {}
 
-    if "boundary_tags" in parent.attrs:
-        boundary_tags = pickle.loads(parent.attrs["boundary_tags"].tobytes())
+    if isinstance(parent.get("boundary_tags"), h5py.Group):
+        boundary_tags = load_from_type(parent["boundary_tags"])
+    else:
+        # NOTE: older files store the pickled tags directly
+        boundary_tags = pickle_from_group("boundary_tags", parent)
+
+    if boundary_tags is not None:
         kwargs["boundary_tags"] = boundary_tags
 
     from dataclasses import is_dataclass
@@ -275,13 +393,13 @@ def _load_mesh(parent: PickleGroup) -> Mesh:
         kwargs["factory_constructed"] = True
 
     if "vertices" in parent:
-        vertices = parent["vertices"][:]
+        vertices = _read_array_dataset(parent, "vertices")
     else:
         vertices = None
 
     is_conforming = parent.attrs.get("is_conforming", None)
-    vertex_id_dtype = load_from_type(parent["vertex_id_dtype"])
-    element_id_dtype = load_from_type(parent["element_id_dtype"])
+    vertex_id_dtype = _load_dtype_attr(parent, "vertex_id_dtype")
+    element_id_dtype = _load_dtype_attr(parent, "element_id_dtype")
     groups = load_from_type(parent["groups"])
 
     # TODO
@@ -305,6 +423,12 @@ def _load_mesh(parent: PickleGroup) -> Mesh:
 # {{{ discretization
 
 
+class _StubMeshElementGroup(NamedTuple):
+    """Stands in for the mesh element group when loading element groups."""
+
+    dim: int
+
+
 class _SameElementGroupFactory:
     """Recreates the given groups for a new mesh.
 
@@ -317,15 +441,17 @@ class _SameElementGroupFactory:
             :class:`~meshmode.discretization.ElementGroupBase`.
         """
 
-        self.groups = groups
+        # NOTE: the constructor arguments are determined once here, so that
+        # each call only needs to supply the new mesh element group
+        self._factories_iter = iter([
+            partial(grp.__class__, order=grp.order, family=grp.family)
+            if isinstance(grp, PolynomialRecursiveNodesElementGroup)
+            else partial(grp.__class__, order=grp.order)
+            for grp in groups
+        ])
 
     def __call__(self, mesh_el_group: MeshElementGroup) -> ElementGroupBase:
-        grp = self.groups.pop(0)
-
-        if isinstance(grp, PolynomialRecursiveNodesElementGroup):
-            return type(grp)(mesh_el_group, grp.order, grp.family)
-
-        return type(grp)(mesh_el_group, grp.order)
+        return next(self._factories_iter)(mesh_el_group)
 
 
 @dumper.register(ElementGroupBase)
@@ -335,21 +461,15 @@ def _dump_element_group(
     # NOTE: these are dumped only for use in Discretization at the moment.
     # There we don't really need to dump mesh_el_group again
     group = parent.create_type(name, obj)
-
-    _dump_order(group, obj.order)
-    group.attrs["dim"] = obj.dim
+    _dump_element_group_attrs(group, obj)
 
 
 @loader.register(ElementGroupBase)
 def _load_element_group(parent: PickleGroup) -> ElementGroupBase:
     # NOTE: the real mesh_el_group is set by the group factory
-    from collections import namedtuple
+    order, dim = _load_element_group_attrs(parent)
 
-    ElementGroup = namedtuple("ElementGroup", ["dim"])
-    return parent.pycls(
-        ElementGroup(dim=int(parent.attrs["dim"])),
-        _load_order(parent),
-    )
+    return parent.pycls(_StubMeshElementGroup(dim=dim), order)
 
 
 @dumper.register(PolynomialRecursiveNodesElementGroup)
@@ -361,8 +481,7 @@ def _dump_recursivenodes_element_group(
 ) -> None:
     group = parent.create_type(name, obj)
 
-    _dump_order(group, obj.order)
-    group.attrs["dim"] = obj.dim
+    _dump_element_group_attrs(group, obj)
     group.attrs["family"] = obj.family
 
 
@@ -371,16 +490,76 @@ def _load_recursivenodes_element_group(
     parent: PickleGroup,
 ) -> PolynomialRecursiveNodesElementGroup:
     # NOTE: the real mesh_el_group is set by the group factory
-    from collections import namedtuple
-
-    ElementGroup = namedtuple("ElementGroup", ["dim"])
+    order, dim = _load_element_group_attrs(parent)
 
     return parent.pycls(
-        ElementGroup(dim=int(parent.attrs["dim"])),
-        _load_order(parent),
-        str(parent.attrs["family"]),
+        _StubMeshElementGroup(dim=dim), order, str(parent.attrs["family"])
+    )
+
+
+class _PackedElementGroups:
+    """Type of the group written by :func:`_dump_element_groups_packed`."""
+
+
+def _dump_element_groups_packed(
+    groups: list[ElementGroupBase], parent: PickleGroup, *, name: str
+) -> bool:
+    # NOTE: groups of the same type are stored as a single compound dataset
+    # instead of a subgroup with attributes for each one of them
+    if not groups:
+        return False
+
+    cls = type(groups[0])
+    if not all(type(grp) is cls and isinstance(grp.order, int) for grp in groups):
+        return False
+
+    # NOTE: subclasses with their own dumper or loader are not packed, since
+    # they may store more than the order, dimension and family
+    if issubclass(cls, PolynomialRecursiveNodesElementGroup):
+        dump, load = (
+            _dump_recursivenodes_element_group,
+            _load_recursivenodes_element_group,
+        )
+    else:
+        dump, load = _dump_element_group, _load_element_group
+
+    if dumper.dispatch(cls) is not dump or loader.dispatch(cls) is not load:
+        return False
+
+    fields = [("order", np.int32), ("dim", np.int32)]
+    if issubclass(cls, PolynomialRecursiveNodesElementGroup):
+        fields.append(("family", h5py.string_dtype()))
+
+    entries = np.array(
+        [tuple(getattr(grp, f) for f, _ in fields) for grp in groups],
+        dtype=fields,
     )
 
+    group = parent.create_group(name).append_type(None, force_cls=_PackedElementGroups)
+    dump_to_attribute(cls, group, name="entry_type")
+    group.create_dataset("entries", data=entries)
+
+    return True
+
+
+@loader.register(_PackedElementGroups)
+def _load_element_groups_packed(parent: PickleGroup) -> list[ElementGroupBase]:
+    # NOTE: the real mesh_el_group is set by the group factory
+
+    cls = load_from_attribute("entry_type", parent)
+    entries = parent["entries"][:]
+
+    if "family" in entries.dtype.names:
+        return [
+            cls(_StubMeshElementGroup(dim=int(dim)), int(order), family.decode())
+            for order, dim, family in entries.tolist()
+        ]
+
+    return [
+        cls(_StubMeshElementGroup(dim=int(dim)), int(order))
+        for order, dim in entries.tolist()
+    ]
+
 
 @dumper.register(Discretization)
 def _dump_discretization(
@@ -389,15 +568,21 @@ def _dump_discretization(
     group = parent.create_type(name, obj)
 
     dumper(obj.mesh, group, name="mesh")
-    dumper(obj.real_dtype, group, name="real_dtype")
-    dumper(obj.groups, group, name="groups")
+    _dump_dtype_attr(group, "real_dtype", obj.real_dtype)
+
+    groups = list(obj.groups)
+    if not _dump_element_groups_packed(groups, group, name="groups_packed"):
+        dumper(obj.groups, group, name="groups")
 
 
 @loader.register(Discretization)
 def _load_discretization(parent: PickleGroup) -> Discretization:
     mesh = load_from_type(parent["mesh"])
-    real_dtype = load_from_type(parent["real_dtype"])
-    groups = load_from_type(parent["groups"])
+    real_dtype = _load_dtype_attr(parent, "real_dtype")
+
+    groups = load_from_type(
+        parent["groups_packed"] if "groups_packed" in parent else parent["groups"]
+    )
 
     actx = get_array_context()
     return parent.pycls(
@@ -420,23 +605,32 @@ def _dump_interpolation_batch(
 ) -> None:
     grp = parent.create_type(name, obj)
 
-    grp.attrs["from_group_index"] = obj.from_group_index
-    if obj.to_element_face is not None:
-        grp.attrs["to_element_face"] = obj.to_element_face
+    # NOTE: a missing to_element_face is stored as -1
+    grp.attrs["group_face"] = np.array([
+        obj.from_group_index,
+        -1 if obj.to_element_face is None else obj.to_element_face,
+    ])
 
-    grp.create_dataset("from_element_indices", data=to_numpy(obj.from_element_indices))
-    grp.create_dataset("to_element_indices", data=to_numpy(obj.to_element_indices))
-    grp.create_dataset("result_unit_nodes", data=obj.result_unit_nodes)
+    _create_index_dataset(
+        grp, "from_element_indices", to_numpy(obj.from_element_indices)
+    )
+    _create_index_dataset(grp, "to_element_indices", to_numpy(obj.to_element_indices))
+    create_array_dataset(grp, "result_unit_nodes", obj.result_unit_nodes)
 
 
 @loader.register(InterpolationBatch)
 def _load_interpolation_batch(parent: PickleGroup) -> InterpolationBatch:
-    from_group_index = parent.attrs["from_group_index"]
-    to_element_face = parent.attrs.get("to_element_face", None)
+    if "group_face" in parent.attrs:
+        from_group_index, to_element_face = parent.attrs["group_face"].tolist()
+        if to_element_face < 0:
+            to_element_face = None
+    else:
+        from_group_index = parent.attrs["from_group_index"]
+        to_element_face = parent.attrs.get("to_element_face", None)
 
-    from_element_indices = parent["from_element_indices"][:]
-    to_element_indices = parent["from_element_indices"][:]
-    result_unit_nodes = parent["result_unit_nodes"][:]
+    from_element_indices = _read_array_dataset(parent, "from_element_indices")
+    to_element_indices = _read_array_dataset(parent, "to_element_indices")
+    result_unit_nodes = _read_array_dataset(parent, "result_unit_nodes")
 
     return parent.pycls(
         from_group_index,
@@ -455,18 +649,114 @@ def _dump_connection_element_group(
     name: str | None = None,
 ) -> None:
     group = parent.create_type(name, obj)
-    dumper(obj.batches, group, name="batches")
+
+    batches = list(obj.batches)
+    if not _dump_interpolation_batches_packed(batches, group, name="batches_packed"):
+        dumper(obj.batches, group, name="batches")
 
 
 @loader.register(DiscretizationConnectionElementGroup)
 def _load_connection_element_group(
     parent: PickleGroup,
 ) -> DiscretizationConnectionElementGroup:
-    batches = load_from_type(parent["batches"])
+    batches = load_from_type(
+        parent["batches_packed"] if "batches_packed" in parent else parent["batches"]
+    )
 
     return parent.pycls(batches)
 
 
+class _PackedInterpolationBatches:
+    """Type of the group written by :func:`_dump_interpolation_batches_packed`."""
+
+
+def _dump_interpolation_batches_packed(
+    batches: list[InterpolationBatch], parent: PickleGroup, *, name: str
+) -> bool:
+    # NOTE: batches of the same type are stored as a few concatenated datasets
+    # and a table with the offsets and scalar fields of each batch
+    if not batches:
+        return False
+
+    cls = type(batches[0])
+    shape = batches[0].result_unit_nodes.shape
+    if not all(
+        type(batch) is cls and batch.result_unit_nodes.shape == shape
+        for batch in batches
+    ):
+        return False
+
+    # NOTE: subclasses with their own dumper or loader are not packed
+    if (
+        dumper.dispatch(cls) is not _dump_interpolation_batch
+        or loader.dispatch(cls) is not _load_interpolation_batch
+    ):
+        return False
+
+    from_element_indices = [to_numpy(b.from_element_indices) for b in batches]
+    to_element_indices = [to_numpy(b.to_element_indices) for b in batches]
+
+    table = np.empty(
+        len(batches),
+        dtype=[
+            ("offset", np.int64),
+            ("from_group_index", np.int64),
+            ("to_element_face", np.int64),
+        ],
+    )
+    table["offset"] = np.cumsum([0, *(x.size for x in from_element_indices[:-1])])
+    table["from_group_index"] = [b.from_group_index for b in batches]
+    table["to_element_face"] = [
+        -1 if b.to_element_face is None else b.to_element_face for b in batches
+    ]
+
+    group = parent.create_group(name).append_type(
+        None, force_cls=_PackedInterpolationBatches
+    )
+    dump_to_attribute(cls, group, name="entry_type")
+    group.create_dataset("batches", data=table)
+    _create_index_dataset(
+        group, "from_element_indices", np.concatenate(from_element_indices)
+    )
+    _create_index_dataset(
+        group, "to_element_indices", np.concatenate(to_element_indices)
+    )
+    create_array_dataset(
+        group,
+        "result_unit_nodes",
+        np.stack([b.result_unit_nodes for b in batches]),
+    )
+
+    return True
+
+
+@loader.register(_PackedInterpolationBatches)
+def _load_interpolation_batches_packed(
+    parent: PickleGroup,
+) -> list[InterpolationBatch]:
+    cls = load_from_attribute("entry_type", parent)
+    table = parent["batches"][:]
+    from_element_indices = _read_array_dataset(parent, "from_element_indices")
+    to_element_indices = _read_array_dataset(parent, "to_element_indices")
+    result_unit_nodes = _read_array_dataset(parent, "result_unit_nodes")
+
+    entries = table.tolist()
+    offsets = [offset for offset, _, _ in entries[1:]] + [from_element_indices.size]
+
+    return [
+        cls(
+            from_group_index,
+            from_element_indices=from_numpy(from_element_indices[start:stop]),
+            to_element_indices=from_numpy(to_element_indices[start:stop]),
+            result_unit_nodes=result_unit_nodes[i],
+            to_element_face=None if to_element_face < 0 else to_element_face,
+        )
+        for i, ((start, from_group_index, to_element_face), stop) in enumerate(
+            zip(entries, offsets, strict=True)
+        )
+    ]
+
+
 @dumper.register(DirectDiscretizationConnection)
 def _dump_direct_connection(
     obj: DirectDiscretizationConnection,
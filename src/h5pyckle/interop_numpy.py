@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -11,6 +12,7 @@ import numpy as np
 from h5pyckle.base import (
     PickleGroup,
     dumper,
+    entry_name,
     load_from_type,
     loader,
     pickle_from_group,
@@ -20,22 +22,80 @@ from h5pyckle.base import (
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import h5py
 
-def make_obj_array(arrays: Sequence[Any]) -> np.ndarray:
-    result = np.empty((len(arrays),), dtype=object)
 
+def make_obj_array(arrays: Sequence[Any]) -> np.ndarray:
     # 'result[:] = res_list' may look tempting, however:
     # https://github.com/numpy/numpy/issues/16564
+    # NOTE: `np.fromiter` does not look inside the entries, but only supports
+    # object arrays since numpy 1.23
+    with suppress(ValueError):
+        return np.fromiter(arrays, dtype=object, count=len(arrays))
+
+    result = np.empty((len(arrays),), dtype=object)
     for i, ary in enumerate(arrays):
         result[i] = ary
 
     return result
 
 
+# NOTE: target size of a chunk for large datasets, in bytes
+_CHUNK_NBYTES = 2**20
+
+
+def _pick_chunks(shape: tuple[int, ...], itemsize: int) -> tuple[int, ...] | None:
+    # NOTE: small datasets are left contiguous. Otherwise, the chunks span the
+    # full trailing axes and are only split along the first axis for which the
+    # remaining axes fit into the target size
+    size = int(np.prod(shape)) * itemsize
+    if size == 0 or size <= _CHUNK_NBYTES:
+        return None
+
+    nbytes = size
+    for i, n in enumerate(shape):
+        nbytes //= n
+        if nbytes <= _CHUNK_NBYTES:
+            return (*(1,) * i, max(1, min(n, _CHUNK_NBYTES // nbytes)), *shape[i + 1 :])
+
+    # NOTE: a single item is larger than the target size (e.g. large void
+    # dtypes), so the dataset is left contiguous
+    return None
+
+
+def create_array_dataset(
+    parent: PickleGroup, name: str, ary: np.ndarray
+) -> h5py.Dataset:
+    """Create a dataset in *parent* that stores the array *ary*.
+
+    Large arrays are chunked and numeric arrays are also compressed. Any
+    options in :attr:`PickleGroup.h5_dset_options` take precedence.
+    """
+    chunks = _pick_chunks(ary.shape, ary.dtype.itemsize)
+    if chunks is None:
+        return parent.create_dataset(name, data=ary)
+
+    options: dict[str, Any] = {"chunks": chunks}
+    if ary.dtype.kind in "iuf":
+        # NOTE: shuffling the bytes before compressing helps quite a bit
+        # with numeric data, e.g. node coordinates or element indices. gzip is
+        # used since it is built into HDF5 and readable outside of h5py
+        options.update(compression="gzip", shuffle=True)
+
+    return parent.create_dataset(name, data=ary, **options)
+
+
 def load_numpy_dataset(parent, name):
     ds = parent[name]
     if ds.shape == ():
         ds = np.array(ds[()])
+    elif ds.dtype.kind in "biufc":
+        # NOTE: numeric data is read directly into an uninitialized array,
+        # without going through the selection machinery in `__getitem__`
+        ary = np.empty(ds.shape, dtype=ds.dtype)
+        if ary.size:
+            ds.read_direct(ary)
+        ds = ary
     else:
         ds = ds[:]
 
@@ -45,6 +105,27 @@ def load_numpy_dataset(parent, name):
     return ds
 
 
+def _is_stackable_obj_array(obj: np.ndarray) -> bool:
+    if obj.size == 0:
+        return False
+
+    first = obj.flat[0]
+    if type(first) is not np.ndarray or first.dtype.kind not in "biufc":
+        return False
+
+    # NOTE: entries of a stacked array of 0-d arrays would come back as numpy
+    # scalars instead, so these are stored separately
+    if first.ndim == 0:
+        return False
+
+    return all(
+        type(ary) is np.ndarray
+        and ary.dtype == first.dtype
+        and ary.shape == first.shape
+        for ary in obj.flat
+    )
+
+
 # {{{ dtype
 
 
@@ -80,20 +161,36 @@ def _dump_ndarray(
         pickle_to_group(obj.__dict__, grp, name="__dict__")
 
     if obj.dtype.char == "O":
-        for i, ary in enumerate(obj):
-            dumper(ary, grp, name=f"entry_{i}")
+        if _is_stackable_obj_array(obj):
+            # NOTE: entries with the same shape and dtype are stored in a single
+            # dataset, instead of a group for each one of them
+            ds = create_array_dataset(grp, "entries", np.stack(list(obj.flat)))
+            if obj.ndim != 1:
+                ds.attrs["shape"] = obj.shape
+        else:
+            for i, ary in enumerate(obj):
+                dumper(ary, grp, name=entry_name(i))
     else:
-        grp.create_dataset("entry", data=obj)
+        create_array_dataset(grp, "entry", obj)
 
 
 @loader.register(np.ndarray)
 def _load_ndarray(parent: PickleGroup) -> np.ndarray:
     dtype = load_from_type(parent, cls=np.dtype)
 
-    if dtype.char == "O":
-        obj = make_obj_array([
-            load_from_type(parent[name]) for name in sorted(parent.keys())
-        ])
+    if dtype.char == "O" and "entries" in parent:
+        ds = parent["entries"]
+        obj = make_obj_array(list(ds[()]))
+        if "shape" in ds.attrs:
+            obj = obj.reshape(tuple(ds.attrs["shape"]))
+    elif dtype.char == "O":
+        # NOTE: entries are all named "entry_XXXX", so we place them directly
+        # by their index instead of sorting the (non-padded) names
+        names = [name for name in parent if name.startswith("entry_")]
+
+        obj = np.empty((len(names),), dtype=object)
+        for name in names:
+            obj[int(name[6:])] = load_from_type(parent[name])
     else:
         obj = load_numpy_dataset(parent, "entry")
 
@@ -156,12 +156,152 @@ def test_discretization_pickling(ambient_dim: int, target_order: int) -> None:
     logger.info("error[conns]:  %.5e", error)
     assert error < 1.0e-15
 
+    # check connection batches are the same
+    for cgrp, cgrp_new in zip(conn.groups, conn_new.groups, strict=True):
+        for batch, batch_new in zip(cgrp.batches, cgrp_new.batches, strict=True):
+            assert batch.from_group_index == batch_new.from_group_index
+            assert batch.to_element_face == batch_new.to_element_face
+            assert np.array_equal(
+                actx.to_numpy(batch.from_element_indices),
+                actx.to_numpy(batch_new.from_element_indices),
+            )
+            assert np.array_equal(
+                actx.to_numpy(batch.to_element_indices),
+                actx.to_numpy(batch_new.to_element_indices),
+            )
+            assert np.array_equal(batch.result_unit_nodes, batch_new.result_unit_nodes)
+
     # }}}
 
 
 # }}}
 
 
+# {{{ test_element_groups_pickling
+
+
+@pytest.mark.meshmode
+def test_element_groups_pickling() -> None:
+    """Tests that packed element groups round-trip on their own."""
+
+    pytest.importorskip("meshmode")
+
+    import pyopencl as cl
+    from meshmode.array_context import PyOpenCLArrayContext
+
+    ctx = cl.create_some_context()
+    queue = cl.CommandQueue(ctx)
+    actx = PyOpenCLArrayContext(queue, force_device_scalars=True)
+
+    import meshmode.mesh.generation as mmg
+    from meshmode.discretization import Discretization
+    from meshmode.discretization.poly_element import default_simplex_group_factory
+
+    mesh = mmg.make_curve_mesh(
+        partial(mmg.ellipse, 1.0), np.linspace(0.0, 1.0, 17), order=3
+    )
+    discr = Discretization(actx, mesh, default_simplex_group_factory(2, 3))
+
+    import h5py
+
+    from h5pyckle import dump, load, load_from_group
+    from h5pyckle.interop_meshmode import array_context_for_pickling
+
+    filename = dirname / "pickle_element_groups.h5"
+    with array_context_for_pickling(actx):
+        dump({"Discretization": discr}, filename)
+        discr_new = load(filename)["Discretization"]
+
+    assert [type(grp) for grp in discr_new.groups] == [
+        type(grp) for grp in discr.groups
+    ]
+    assert [grp.order for grp in discr_new.groups] == [
+        grp.order for grp in discr.groups
+    ]
+
+    # NOTE: the packed groups have their own type, so they can be loaded directly
+    with h5py.File(filename, mode="r") as h5:
+        groups = load_from_group(h5["Discretization"]["groups_packed"])
+
+    assert [type(grp) for grp in groups] == [type(grp) for grp in discr.groups]
+    assert [grp.dim for grp in groups] == [grp.dim for grp in discr.groups]
+
+
+# }}}
+
+
+# {{{ test_mesh_pickling_by_pattern
+
+
+@pytest.mark.meshmode
+def test_mesh_pickling_by_pattern() -> None:
+    """Tests that the arrays of a dumped mesh can be found by name."""
+
+    pytest.importorskip("meshmode")
+
+    import meshmode.mesh.generation as mmg
+
+    mesh = mmg.make_curve_mesh(
+        partial(mmg.ellipse, 1.0), np.linspace(0.0, 1.0, 17), order=3
+    )
+
+    import h5py
+
+    from h5pyckle import dump, load_by_pattern
+
+    filename = dirname / "pickle_mesh_by_pattern.h5"
+    dump({"Mesh": mesh}, filename)
+
+    # NOTE: all the datasets of the mesh are stored in its own group
+    with h5py.File(filename, mode="r") as h5:
+        assert list(h5) == ["Mesh"]
+
+        unit_nodes = load_by_pattern(h5, pattern="unit_nodes")
+        assert np.array_equal(unit_nodes, mesh.groups[0].unit_nodes)
+
+        unit_nodes = load_by_pattern(h5["Mesh"], pattern="unit_nodes")
+        assert np.array_equal(unit_nodes, mesh.groups[0].unit_nodes)
+
+
+# }}}
+
+
+# {{{ test_mesh_pickling_repeated
+
+
+@pytest.mark.meshmode
+def test_mesh_pickling_repeated() -> None:
+    """Tests that the same mesh can be dumped repeatedly."""
+
+    pytest.importorskip("meshmode")
+
+    import meshmode.mesh.generation as mmg
+
+    mesh = mmg.make_curve_mesh(
+        partial(mmg.ellipse, 1.0), np.linspace(0.0, 1.0, 17), order=3
+    )
+
+    from h5pyckle import dump, load
+
+    filename = dirname / "pickle_mesh_repeated.h5"
+    dump({"Mesh": mesh, "SameMesh": mesh}, filename)
+    dump({"Mesh": mesh}, filename)
+    mesh_out = load(filename)["Mesh"]
+
+    assert np.array_equal(mesh_out.vertices, mesh.vertices)
+    assert np.array_equal(mesh_out.groups[0].nodes, mesh.groups[0].nodes)
+
+    dump({"Mesh": mesh, "SameMesh": mesh}, filename)
+    arg_out = load(filename)
+
+    for key in ("Mesh", "SameMesh"):
+        assert np.array_equal(arg_out[key].vertices, mesh.vertices)
+        assert np.array_equal(arg_out[key].groups[0].nodes, mesh.groups[0].nodes)
+
+
+# }}}
+
+
 # {{{ test_record_pickling
 
 
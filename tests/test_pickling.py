@@ -45,6 +45,8 @@ def rnorm(x: np.ndarray, y: np.ndarray) -> float:
     [
         {},
         {"key": 1, "value": "dict"},
+        {"x": 1.0, "y": 2.5, "z": -3.0},
+        {"nx": 1, "ny": 2, "nz": 3},
         {
             "author": {
                 "name": "John",
@@ -55,6 +57,9 @@ def rnorm(x: np.ndarray, y: np.ndarray) -> float:
                 ],
             }
         },
+        {"zeta": [1, "one"], "alpha": [2, "two"]},
+        {"__items": [1, "one"], "__layout": "items"},
+        {"__shared": [1, "one"], "nested": {"__shared": "attribute"}},
         {
             "long_int": 123456789101112131415,
             "long_float": 3.14159265358979323846264338327950288419716939937510582097494,
@@ -70,6 +75,7 @@ def test_pickling_dict(arg_in: dict[str, str]) -> None:
     logger.info("expected: %s", arg_in)
     logger.info("got:      %s", arg_out)
     assert arg_in == arg_out
+    assert list(arg_in) == list(arg_out)
 
 
 # }}}
@@ -112,7 +118,9 @@ def test_pickling_list_like(arg_in: list[Any]) -> None:
 # {{{ test_pickling_numpy
 
 
-@pytest.mark.parametrize("arg_in_type", ["scalar", "object"])
+@pytest.mark.parametrize(
+    "arg_in_type", ["scalar", "object", "object_ragged", "object_0d"]
+)
 @pytest.mark.parametrize("dtype_in", [np.int32, np.float32, np.float64])
 def test_pickling_numpy(arg_in_type: str, dtype_in: Any) -> None:
     filename = dirname / "pickle_numpy.h5"
@@ -135,21 +143,141 @@ def test_pickling_numpy(arg_in_type: str, dtype_in: Any) -> None:
             arg_in = make_obj_array([
                 rng.random(size=42, dtype=dtype_in) for _ in range(3)
             ])
+    elif arg_in_type == "object_ragged":
+        from h5pyckle.interop_numpy import make_obj_array
+
+        arg_in = make_obj_array([np.arange(n, dtype=dtype_in) for n in range(1, 13)])
+    elif arg_in_type == "object_0d":
+        from h5pyckle.interop_numpy import make_obj_array
+
+        arg_in = make_obj_array([np.array(n, dtype=dtype_in) for n in range(1, 13)])
     else:
         raise ValueError(f"unknown type: '{arg_in_type}'")
 
     dump({"array": arg_in}, filename)
     arg_out = load(filename)["array"]
 
-    error = rnorm(arg_out, arg_in)
+    if arg_in_type in {"object_ragged", "object_0d"}:
+        error = max(rnorm(x, y) for x, y in zip(arg_out, arg_in, strict=True))
+    else:
+        error = rnorm(arg_out, arg_in)
     logger.info("error[%s, %s]: %.5e", arg_in_type, dtype_in, error)
     assert error < 1.0e-15
 
     assert arg_out.dtype == arg_in.dtype
     if arg_in.dtype.char == "O":
+        assert all(type(x) is np.ndarray for x in arg_out)
         assert arg_out[0].dtype == arg_in[0].dtype
 
 
+def test_pickling_numpy_chunked() -> None:
+    import h5py
+
+    filename = dirname / "pickle_numpy_chunked.h5"
+
+    arg_in = np.linspace(-1.0, 1.0, 2**18).reshape(-1, 8)
+    dump({"array": arg_in}, filename)
+    arg_out = load(filename)["array"]
+
+    assert np.array_equal(arg_in, arg_out)
+
+    with h5py.File(filename, mode="r") as h5:
+        ds = h5["array/entry"]
+        assert ds.chunks is not None
+        assert ds.chunks[1:] == arg_in.shape[1:]
+        assert ds.compression == "gzip"
+        assert ds.shuffle
+
+    # NOTE: items larger than the target chunk size are not chunked at all
+    void_in = np.zeros(3, dtype="V2000000")
+    dump({"array": void_in}, filename)
+    void_out = load(filename)["array"]
+
+    assert void_out.dtype == void_in.dtype
+    assert np.array_equal(void_in, void_out)
+
+    with h5py.File(filename, mode="r") as h5:
+        assert h5["array/entry"].chunks is None
+
+
+def test_pickling_file_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    import h5py
+
+    filename = dirname / "pickle_file_options.h5"
+
+    arg_in = {"array": np.ones(42)}
+    dump(arg_in, filename)
+
+    caches = []
+
+    class File(h5py.File):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            caches.append(self.id.get_access_plist().get_cache())
+
+    monkeypatch.setattr(h5py, "File", File)
+
+    rdcc_nbytes = 4 * 1024**2
+    arg_out = load(filename, h5_file_options={"rdcc_nbytes": rdcc_nbytes})
+
+    assert np.array_equal(arg_in["array"], arg_out["array"])
+    assert len(caches) == 1
+    assert caches[0][2] == rdcc_nbytes
+
+
+def test_pickling_append_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    import h5py
+
+    filename = dirname / "pickle_append_options.h5"
+    with h5py.File(filename, mode="w") as h5:
+        h5.create_dataset("raw", data=np.ones(3))
+
+    options = []
+
+    class File(h5py.File):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            options.append(kwargs)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(h5py, "File", File)
+
+    # NOTE: the defaults for new files should not be used when appending
+    dump({"x": np.ones(3)}, filename, mode="a")
+    assert options[-1] == {"mode": "a"}
+
+    dump({"x": np.ones(3)}, dirname / "pickle_new_options.h5", mode="w")
+    assert options[-1]["libver"] == ("v110", "latest")
+    assert options[-1]["track_order"]
+
+    assert set(load(filename)) == {"raw", "x"}
+
+
+def test_pickling_compression_small() -> None:
+    import h5py
+
+    filename = dirname / "pickle_compression_small.h5"
+
+    # NOTE: the frozenset is pickled into a 1-D uint8 dataset that, like the
+    # small array, is below the size where compression is worth it, while the
+    # large array should still use the given options
+    large = np.ones(2**16)
+    arg_in = {
+        "small": np.ones(3),
+        "large": large,
+        "pickled": frozenset(map(str, range(4096))),
+    }
+    dump(arg_in, filename, h5_dset_options={"compression": "gzip"})
+    arg_out = load(filename)
+
+    assert arg_in["pickled"] == arg_out["pickled"]
+    assert np.array_equal(large, arg_out["large"])
+
+    with h5py.File(filename, mode="r") as h5:
+        assert h5["small/entry"].compression is None
+        assert h5["pickled/state"].compression is None
+        assert h5["large/entry"].compression == "gzip"
+
+
 # }}}
 
 
@@ -266,6 +394,186 @@ def test_pickling_dataclass() -> None:
     assert np.allclose(arg_in.paychecks, arg_out.paychecks, atol=3.0e-16)
 
 
+@h5pyckable
+@dataclass(frozen=True)
+class Point:
+    label: str
+    x: float
+    y: float
+    index: int
+    active: bool
+
+
+def test_pickling_dataclass_records() -> None:
+    import h5py
+
+    filename = dirname / "pickle_dataclass_records.h5"
+
+    arg_in = {
+        "points": [Point(f"p{i}", i / 3, -i / 7, i, i % 2 == 0) for i in range(32)],
+    }
+    dump(arg_in, filename)
+    arg_out = load(filename)
+
+    assert arg_in == arg_out
+    assert all(isinstance(p.active, bool) for p in arg_out["points"])
+
+    with h5py.File(filename, mode="r") as h5:
+        assert "records" in h5["points"]
+
+
+@pytest.mark.parametrize(
+    "point",
+    [
+        Point(None, 1.0, 2.0, 3, active=True),  # type: ignore[arg-type]
+        Point(3, 1.0, 2.0, 3, active=True),  # type: ignore[arg-type]
+        Point("p", 1.0, 2.0, 1.7, active=True),  # type: ignore[arg-type]
+        Point("p", 1.0, 2.0, 3, active="no"),  # type: ignore[arg-type]
+        Point("p", 1.0, 2.0, 3, active=2),  # type: ignore[arg-type]
+        Point("p", 1, 2.0, 3, active=True),
+    ],
+)
+def test_pickling_dataclass_records_mismatch(point: Point) -> None:
+    import dataclasses
+
+    import h5py
+
+    filename = dirname / "pickle_dataclass_records.h5"
+
+    # NOTE: values that do not match their annotation cannot be packed without
+    # changing them, so these are stored entry by entry
+    arg_in = {"points": [Point("p0", 0.5, 0.5, 0, active=True), point]}
+    dump(arg_in, filename)
+    arg_out = load(filename)
+
+    assert arg_in == arg_out
+    assert [type(v) for v in dataclasses.astuple(arg_out["points"][1])] == [
+        type(v) for v in dataclasses.astuple(point)
+    ]
+
+    with h5py.File(filename, mode="r") as h5:
+        assert "records" not in h5["points"]
+
+
+# }}}
+
+
+# {{{ test_pickling_missing_class
+
+
+@h5pyckable
+@dataclass(frozen=True)
+class Moved:
+    name: str
+
+
+def test_pickling_missing_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    import h5py
+
+    from h5pyckle import PickleGroup, load_from_group, load_from_type
+
+    filename = dirname / "pickle_missing_class.h5"
+    dump({"moved": Moved("here")}, filename)
+
+    # NOTE: a class that cannot be found anymore (e.g. it was renamed or moved)
+    # should not be reported as missing type information
+    monkeypatch.delattr(sys.modules[__name__], "Moved")
+
+    with pytest.raises(AttributeError, match="Moved"):
+        load(filename)
+
+    with h5py.File(filename, mode="a") as h5:
+        with pytest.raises(AttributeError, match="Moved"):
+            load_from_group(h5["moved"])
+
+        with pytest.raises(ValueError, match="cannot find type information"):
+            load_from_type(PickleGroup.from_h5(h5.create_group("untyped")))
+
+
+# }}}
+
+
+# {{{ test_pickling_group_copy
+
+
+def test_pickling_group_copy() -> None:
+    import h5py
+
+    from h5pyckle import load_from_group
+
+    filename = dirname / "pickle_group_copy.h5"
+    filename_copy = dirname / "pickle_group_copy_out.h5"
+
+    arg_in = {"employees": [Employee("John", "CEO", 42, (1, 2022), np.ones(3))] * 8}
+    dump(arg_in, filename)
+
+    # NOTE: type information is stored inside each group, so a copy of a group
+    # can be loaded on its own from a different file
+    with h5py.File(filename, mode="r") as src, h5py.File(filename_copy, "w") as dst:
+        src.copy(src["employees"], dst, name="copied")
+        assert list(dst) == ["copied"]
+
+        arg_out = load_from_group(dst["copied"])
+
+    assert arg_in["employees"] == arg_out
+
+
+# }}}
+
+
+# {{{ test_pickling_by_pattern
+
+
+def test_pickling_by_pattern() -> None:
+    import h5py
+
+    from h5pyckle import load_by_pattern
+
+    filename = dirname / "pickle_by_pattern.h5"
+
+    # NOTE: plain datasets that were not written by h5pyckle are found as well
+    with h5py.File(filename, mode="w") as h5:
+        h5.create_dataset("raw", data=np.ones(3))
+
+    x_f = np.arange(5)
+    params = {"alpha": 1.5, "beta": 2.0}
+    arg_in = {"x_d": [1, "one"], "x_f": x_f, "params": params}
+    dump(arg_in, filename, mode="a")
+
+    with h5py.File(filename, mode="r") as h5:
+        assert load_by_pattern(h5, pattern="x_d") == arg_in["x_d"]
+        assert load_by_pattern(h5, pattern="alpha") == params["alpha"]
+        assert load_by_pattern(h5["params"], pattern="beta") == params["beta"]
+        assert np.array_equal(load_by_pattern(h5, pattern="x_f"), x_f)
+        assert np.array_equal(load_by_pattern(h5, pattern="raw"), np.ones(3))
+
+    assert set(load(filename)) == {"raw", *arg_in}
+
+
+# }}}
+
+
+# {{{ test_pickling_out_of_band
+
+
+def test_pickling_out_of_band() -> None:
+    from types import SimpleNamespace
+
+    import h5py
+
+    filename = dirname / "pickle_out_of_band.h5"
+
+    arg_in = SimpleNamespace(small=np.ones(3), large=np.linspace(0.0, 1.0, 4096))
+    dump({"obj": arg_in}, filename)
+    arg_out = load(filename)["obj"]
+
+    assert np.array_equal(arg_in.small, arg_out.small)
+    assert np.array_equal(arg_in.large, arg_out.large)
+
+    with h5py.File(filename, mode="r") as h5:
+        assert len(h5["obj/state__buffers"]) == 1
+
+
 # }}}
 
 